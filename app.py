@@ -6,6 +6,13 @@ from email.message import EmailMessage
 from datetime import datetime, date, timedelta
 import hashlib
 import uuid
+import zipfile
+import time
+import threading
+import base64
+import hmac
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote
 import pandas as pd
 
 # ---------------------- CONFIG ----------------------
@@ -17,6 +24,16 @@ ROLES = ['staff', 'manager']
 UPLOAD_FOLDER = 'uploads'
 PAYMENT_UPLOAD_FOLDER = 'payment_receipts'
 FILE_STATE = 'file_state.json'
+ZIP_CHUNK_SIZE = 1024 * 1024
+STORED_EXTENSIONS = ('.pdf', '.jpg', '.jpeg', '.png')
+DOSSIER_EXPORT_HOST = os.environ.get('DOSSIER_EXPORT_HOST', '127.0.0.1')
+DOSSIER_EXPORT_PORT = int(os.environ.get('DOSSIER_EXPORT_PORT', 8599))
+DOSSIER_EXPORT_URL = os.environ.get('DOSSIER_EXPORT_URL', f"http://localhost:{DOSSIER_EXPORT_PORT}")
+DOSSIER_LINK_TTL = 600
+EXPORT_SECRET_FILE = '.export_secret'
+CHANGE_LOG = 'changes.log'
+CHANGE_LOG_MAX_BYTES = 1024 * 1024
+LIVE_REFRESH_SECONDS = float(os.environ.get('LIVE_REFRESH_SECONDS', 2))
 
 PHASES = {
     "Phase 1: Contract": ["Signed Contract", "Registration Form"],
@@ -28,6 +45,8 @@ PHASES = {
     "Phase 7: Payment & Handover": ["Bank Advice", "Transit Agreement", "Final Invoice"]
 }
 
+DB_FILES = [USER_DB, ORGANIZATION_DB, DATA_FILE, FILE_STATE, PAYMENT_DB]
+
 # Initialize data files with proper structure
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
@@ -35,11 +54,14 @@ if not os.path.exists(UPLOAD_FOLDER):
 if not os.path.exists(PAYMENT_UPLOAD_FOLDER):
     os.makedirs(PAYMENT_UPLOAD_FOLDER)
 
-for db_file in [USER_DB, ORGANIZATION_DB, DATA_FILE, FILE_STATE, PAYMENT_DB]:
+for db_file in DB_FILES:
     if not os.path.exists(db_file):
         with open(db_file, 'w') as f:
             json.dump({}, f)
 
+if not os.path.exists(CHANGE_LOG):
+    open(CHANGE_LOG, 'a').close()
+
 if 'logged_in' not in st.session_state:
     st.session_state.update({
         'logged_in': False,
@@ -75,73 +97,187 @@ def send_email(recipient, subject, body):
         st.error(f"Email sending failed: {str(e)}")
     return False
 
+# ---------------------- CHANGE FEED ----------------------
+# Every save appends one JSON line to CHANGE_LOG. Appends are atomic with
+# O_APPEND, so each Streamlit worker only has to stat the log and read the
+# new lines to learn which databases other workers have rewritten.
+@st.cache_resource
+def _db_cache():
+    return {'lock': threading.Lock(), 'position': _log_position(), 'tables': {}, 'versions': {}}
+
+def _log_position():
+    try:
+        stat = os.stat(CHANGE_LOG)
+    except OSError:
+        return None, 0
+    return stat.st_ino, stat.st_size
+
+def publish_change(db_file):
+    line = json.dumps({'db': db_file, 'ts': time.time(), 'pid': os.getpid()}) + '\n'
+    fd = os.open(CHANGE_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode())
+        size = os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+    if size > CHANGE_LOG_MAX_BYTES:
+        rotate_change_log()
+
+def rotate_change_log():
+    # The new log has a new inode, which readers treat as a reset. An event
+    # a concurrent writer appends to the old file is lost, but _load_db
+    # still notices the change through the database's stat signature.
+    tmp_file = f"{CHANGE_LOG}.{os.getpid()}.tmp"
+    open(tmp_file, 'w').close()
+    os.replace(tmp_file, CHANGE_LOG)
+
+def read_changes(position):
+    inode, offset = position
+    try:
+        stat = os.stat(CHANGE_LOG)
+    except OSError:
+        return None, (None, 0)
+    if stat.st_ino != inode or stat.st_size < offset:
+        # Log was rotated, truncated or removed; the caller must drop everything.
+        return None, (stat.st_ino, stat.st_size)
+    if stat.st_size == offset:
+        return [], position
+
+    with open(CHANGE_LOG, 'rb') as f:
+        f.seek(offset)
+        chunk = f.read(stat.st_size - offset)
+    # Leave a partially written trailing line for the next read
+    end = chunk.rfind(b'\n') + 1
+    events = []
+    for line in chunk[:end].splitlines():
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict):
+            events.append(event)
+    return events, (inode, offset + end)
+
+def sync_changes():
+    cache = _db_cache()
+    with cache['lock']:
+        events, cache['position'] = read_changes(cache['position'])
+        if events is None:
+            changed = set(DB_FILES)
+        else:
+            changed = {event.get('db') for event in events} & set(DB_FILES)
+        for db_file in changed:
+            cache['tables'].pop(db_file, None)
+            cache['versions'][db_file] = cache['versions'].get(db_file, 0) + 1
+    return changed
+
+def db_versions(*db_files):
+    # Cheap change check for callers that only want to know whether to
+    # recompute: reads the change feed and stats each database, so writes
+    # that bypassed _save_db are noticed too.
+    sync_changes()
+    cache = _db_cache()
+    with cache['lock']:
+        for db_file in db_files:
+            entry = cache['tables'].get(db_file)
+            if entry is not None and entry['signature'] != _db_signature(db_file):
+                del cache['tables'][db_file]
+                cache['versions'][db_file] = cache['versions'].get(db_file, 0) + 1
+        return tuple(cache['versions'].get(db_file, 0) for db_file in db_files)
+
 # ---------------------- DATA MANAGEMENT ----------------------
-def load_organizations():
+def _db_signature(db_file):
     try:
-        with open(ORGANIZATION_DB, 'r') as f:
-            data = json.load(f)
-            return {k: v for k, v in data.items() if isinstance(v, dict)}
-    except:
+        stat = os.stat(db_file)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+def _parse_db(raw):
+    try:
+        data = json.loads(raw)
+        return {k: v for k, v in data.items() if isinstance(v, dict)}
+    except (ValueError, AttributeError):
         return {}
 
-def save_organizations(orgs):
-    with open(ORGANIZATION_DB, 'w') as f:
-        json.dump(orgs, f, indent=2)
+def _read_db(db_file):
+    try:
+        with open(db_file, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            raw = f.read()
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        signature, raw = None, b''
+    return {'signature': signature, 'raw': raw, 'data': _parse_db(raw)}
 
-def load_users():
+def _load_db(db_file, readonly=False):
+    # readonly tables are shared by every session in the process and must
+    # not be modified; everyone else gets a private copy.
+    sync_changes()
+    cache = _db_cache()
+    with cache['lock']:
+        entry = cache['tables'].get(db_file)
+    if entry is None or entry['signature'] != _db_signature(db_file):
+        stale = entry is not None
+        entry = _read_db(db_file)
+        with cache['lock']:
+            cache['tables'][db_file] = entry
+            if stale:
+                cache['versions'][db_file] = cache['versions'].get(db_file, 0) + 1
+    if readonly:
+        return entry['data']
+    # Re-parsing the cached bytes is cheaper than deep-copying the table
+    return _parse_db(entry['raw'])
+
+def _save_db(db_file, data):
+    # Write to a temp file and rename so other workers never read a
+    # half-written database.
+    tmp_file = f"{db_file}.{os.getpid()}.{threading.get_ident()}.tmp"
     try:
-        with open(USER_DB, 'r') as f:
-            data = json.load(f)
-            return {k: v for k, v in data.items() if isinstance(v, dict)}
-    except:
-        return {}
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_file, db_file)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+    publish_change(db_file)
+
+def load_organizations(readonly=False):
+    return _load_db(ORGANIZATION_DB, readonly)
+
+def save_organizations(orgs):
+    _save_db(ORGANIZATION_DB, orgs)
+
+def load_users(readonly=False):
+    return _load_db(USER_DB, readonly)
 
 def save_users(users):
-    with open(USER_DB, 'w') as f:
-        json.dump(users, f, indent=2)
+    _save_db(USER_DB, users)
 
-def load_payments():
-    try:
-        with open(PAYMENT_DB, 'r') as f:
-            data = json.load(f)
-            return {k: v for k, v in data.items() if isinstance(v, dict)}
-    except:
-        return {}
+def load_payments(readonly=False):
+    return _load_db(PAYMENT_DB, readonly)
 
 def save_payments(payments):
-    with open(PAYMENT_DB, 'w') as f:
-        json.dump(payments, f, indent=2)
+    _save_db(PAYMENT_DB, payments)
 
-def load_file_state():
-    try:
-        with open(FILE_STATE, 'r') as f:
-            data = json.load(f)
-            return {k: v for k, v in data.items() if isinstance(v, dict)}
-    except:
-        return {}
+def load_file_state(readonly=False):
+    return _load_db(FILE_STATE, readonly)
 
 def save_file_state(state):
-    with open(FILE_STATE, 'w') as f:
-        json.dump(state, f, indent=2)
+    _save_db(FILE_STATE, state)
 
-def load_data():
-    try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-            return {k: v for k, v in data.items() if isinstance(v, dict)}
-    except:
-        return {}
+def load_data(readonly=False):
+    return _load_db(DATA_FILE, readonly)
 
 def save_data(data):
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    _save_db(DATA_FILE, data)
 
 # ---------------------- PAYMENT FUNCTIONS ----------------------
 def check_payment_status(organization):
     if not organization:
         return False
         
-    payments = load_payments()
+    payments = load_payments(readonly=True)
     org_payment = payments.get(organization, {})
     
     if not org_payment:
@@ -212,6 +348,314 @@ def submit_phase(user, phase, organization):
         save_data(data)
         st.success(f"{phase} has been submitted.")
 
+# ---------------------- DOSSIER EXPORT ----------------------
+class _ZipStream:
+    # Write-only, unseekable sink: entries can be emitted as soon as they
+    # are written, without a temporary archive.
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def _safe_arcname(part):
+    return "".join("_" if c in '\\/:*?"<>|' else c for c in str(part)).strip() or "_"
+
+def _parse_timestamp(value):
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+def find_uploaded_file(org_key, meta):
+    # Returns (path, match) where match is "recorded", "inferred" or
+    # "ambiguous", or (None, None) when no file is found.
+    stored_name = meta.get("stored_name")
+    if stored_name:
+        path = os.path.join(UPLOAD_FOLDER, stored_name)
+        return (path, "recorded") if os.path.isfile(path) else (None, None)
+
+    # Uploads made before stored_name was recorded: match
+    # f"{org_key}_{uuid}_{filename}". The same filename may have been
+    # uploaded for several documents, so prefer the file written closest
+    # to this document's upload_date.
+    filename = meta.get("filename")
+    if not filename:
+        return None, None
+    prefix, suffix = f"{org_key}_", f"_{filename}"
+    candidates = []
+    try:
+        with os.scandir(UPLOAD_FOLDER) as entries:
+            for entry in entries:
+                if (len(entry.name) != len(prefix) + 36 + len(suffix)
+                        or not entry.name.startswith(prefix) or not entry.name.endswith(suffix)):
+                    continue
+                try:
+                    uuid.UUID(entry.name[len(prefix):len(prefix) + 36])
+                except ValueError:
+                    continue
+                if entry.is_file():
+                    candidates.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        return None, None
+    if not candidates:
+        return None, None
+
+    uploaded_at = _parse_timestamp(meta.get("upload_date"))
+    if uploaded_at is None:
+        path = max(candidates)[1]
+    else:
+        path = min(candidates, key=lambda c: abs(c[0] - uploaded_at))[1]
+    return path, "inferred" if len(candidates) == 1 else "ambiguous"
+
+def collect_dossier(organization, user=None, phase=None):
+    users = load_users(readonly=True)
+    if user:
+        members = [user]
+    else:
+        members = sorted(u for u, data in users.items()
+                         if isinstance(data, dict) and data.get('organization') == organization)
+    phases = [phase] if phase else list(PHASES)
+
+    file_state = load_file_state(readonly=True)
+    documents, missing = [], []
+    for member in members:
+        org_key = f"{organization}_{member}"
+        member_state = file_state.get(org_key, {})
+        for phase_name in phases:
+            phase_docs = member_state.get(phase_name, {})
+            if not isinstance(phase_docs, dict):
+                phase_docs = {}
+            for doc in PHASES.get(phase_name, []):
+                meta = phase_docs.get(doc)
+                path, match = find_uploaded_file(org_key, meta) if isinstance(meta, dict) else (None, None)
+                if path is None:
+                    missing.append({"user": member, "phase": phase_name, "document": doc})
+                    continue
+                documents.append({
+                    "user": member,
+                    "phase": phase_name,
+                    "document": doc,
+                    "filename": meta.get("filename", os.path.basename(path)),
+                    "upload_date": meta.get("upload_date"),
+                    "path": path,
+                    "match": match
+                })
+    return documents, missing
+
+def _zip_date_time(timestamp):
+    # ZIP timestamps cannot predate 1980
+    return max(datetime.fromtimestamp(timestamp), datetime(1980, 1, 1)).timetuple()[:6]
+
+def _write_stored(zf, zinfo, crc, size, chunks):
+    # ZipFile only writes a plain local header when it can seek back and
+    # patch it; on an unseekable sink every entry gets a data descriptor,
+    # which some readers (e.g. Java's ZipInputStream) reject for stored
+    # entries. CRC and size are already known here, so write the header
+    # up front the way ZipFile.open(..., 'w') does on a seekable file.
+    zinfo.compress_type = zipfile.ZIP_STORED
+    zinfo.CRC = crc
+    zinfo.file_size = zinfo.compress_size = size
+    zinfo.header_offset = zf.fp.tell()
+    zf.fp.write(zinfo.FileHeader(size > zipfile.ZIP64_LIMIT))
+    written_crc = 0
+    for chunk in chunks:
+        written_crc = zipfile.crc32(chunk, written_crc)
+        zf.fp.write(chunk)
+        yield
+    if written_crc != crc:
+        raise OSError(f"{zinfo.filename} changed while it was being archived")
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    zf.start_dir = zf.fp.tell()
+    zf._didModify = True
+
+def _read_chunks(path, chunk_size):
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+def iter_dossier_zip(organization, user=None, phase=None, chunk_size=ZIP_CHUNK_SIZE):
+    documents, missing = collect_dossier(organization, user, phase)
+    sink = _ZipStream()
+    manifest_docs = []
+
+    with zipfile.ZipFile(sink, 'w', allowZip64=True) as zf:
+        for item in documents:
+            arcname = "/".join(_safe_arcname(part) for part in
+                               (item["user"], item["phase"], f"{item['document']} - {item['filename']}"))
+            try:
+                stat = os.stat(item["path"])
+                # First pass: CRC for the local header and sha256 for the manifest
+                crc, digest = 0, hashlib.sha256()
+                for chunk in _read_chunks(item["path"], chunk_size):
+                    crc = zipfile.crc32(chunk, crc)
+                    digest.update(chunk)
+            except OSError:
+                missing.append({"user": item["user"], "phase": item["phase"], "document": item["document"]})
+                continue
+
+            uploaded_at = _parse_timestamp(item["upload_date"])
+            zinfo = zipfile.ZipInfo(arcname, date_time=_zip_date_time(uploaded_at or stat.st_mtime))
+            zinfo.external_attr = 0o644 << 16
+            # PDFs and images are already compressed; deflating them again
+            # only costs CPU.
+            if item["filename"].lower().endswith(STORED_EXTENSIONS):
+                for _ in _write_stored(zf, zinfo, crc, stat.st_size, _read_chunks(item["path"], chunk_size)):
+                    data = sink.drain()
+                    if data:
+                        yield data
+            else:
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                zinfo.file_size = stat.st_size
+                with zf.open(zinfo, 'w') as dest:
+                    for chunk in _read_chunks(item["path"], chunk_size):
+                        dest.write(chunk)
+                        data = sink.drain()
+                        if data:
+                            yield data
+
+            manifest_docs.append({
+                "user": item["user"],
+                "phase": item["phase"],
+                "document": item["document"],
+                "filename": item["filename"],
+                "upload_date": item["upload_date"],
+                "archive_path": arcname,
+                "size": stat.st_size,
+                "sha256": digest.hexdigest(),
+                "match": item["match"]
+            })
+            data = sink.drain()
+            if data:
+                yield data
+
+        manifest = json.dumps({
+            "organization": organization,
+            "user": user,
+            "phase": phase,
+            "generated_at": datetime.now().isoformat(),
+            "documents": manifest_docs,
+            "missing": missing
+        }, indent=2).encode()
+        zinfo = zipfile.ZipInfo("manifest.json", date_time=datetime.now().timetuple()[:6])
+        zinfo.external_attr = 0o644 << 16
+        for _ in _write_stored(zf, zinfo, zipfile.crc32(manifest), len(manifest), [manifest]):
+            pass
+
+    data = sink.drain()
+    if data:
+        yield data
+
+def dossier_filename(organization, user=None, phase=None):
+    parts = [organization, user, phase.split(":")[0] if phase else None, date.today().strftime("%Y%m%d")]
+    return "_".join(_safe_arcname(p).replace(" ", "_") for p in parts if p) + "_dossier.zip"
+
+def _export_secret():
+    secret = os.environ.get('DOSSIER_EXPORT_SECRET')
+    if secret:
+        return secret.encode()
+    if not os.path.exists(EXPORT_SECRET_FILE):
+        # Link into place so concurrent workers agree on a single secret
+        tmp_file = f"{EXPORT_SECRET_FILE}.{os.getpid()}.tmp"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(os.urandom(32).hex())
+        try:
+            os.link(tmp_file, EXPORT_SECRET_FILE)
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(tmp_file)
+    with open(EXPORT_SECRET_FILE, 'r') as f:
+        return f.read().strip().encode()
+
+def make_dossier_token(organization, user=None, phase=None):
+    payload = json.dumps({'org': organization, 'user': user, 'phase': phase,
+                          'exp': int(time.time()) + DOSSIER_LINK_TTL})
+    payload = base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+    signature = hmac.new(_export_secret(), payload.encode(), hashlib.sha256).hexdigest()
+    return f"{payload}.{signature}"
+
+def verify_dossier_token(token):
+    payload, _, signature = token.partition('.')
+    expected = hmac.new(_export_secret(), payload.encode(), hashlib.sha256).hexdigest()
+    if not hmac.compare_digest(signature, expected):
+        return None
+    try:
+        request = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    if not isinstance(request, dict) or request.get('exp', 0) < time.time():
+        return None
+    return request.get('org'), request.get('user'), request.get('phase')
+
+class _DossierExportHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        prefix = '/dossier/'
+        request = verify_dossier_token(self.path[len(prefix):]) if self.path.startswith(prefix) else None
+        if request is None:
+            self.send_error(404)
+            return
+
+        filename = dossier_filename(*request)
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/zip')
+        self.send_header('Content-Disposition',
+                         f"attachment; filename=\"{filename.encode('ascii', 'replace').decode()}\"; "
+                         f"filename*=UTF-8''{quote(filename)}")
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        try:
+            for data in iter_dossier_zip(*request):
+                self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except OSError as e:
+            # Headers are already sent; dropping the connection without the
+            # terminating chunk tells the client the download failed.
+            self.log_error("dossier export failed: %s", e)
+
+    def log_request(self, code='-', size='-'):
+        pass
+
+@st.cache_resource
+def _export_server_slot():
+    return {'lock': threading.Lock(), 'server': None}
+
+def start_export_server():
+    # One server per process; when several workers share a host the first
+    # one binds the port and serves links signed by any of them. A failed
+    # bind is retried on the next call in case that worker has exited.
+    slot = _export_server_slot()
+    with slot['lock']:
+        if slot['server'] is None:
+            try:
+                server = ThreadingHTTPServer((DOSSIER_EXPORT_HOST, DOSSIER_EXPORT_PORT), _DossierExportHandler)
+            except OSError:
+                return None
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            slot['server'] = server
+        return slot['server']
+
 # ---------------------- UI COMPONENTS ----------------------
 def display_sidebar():
     st.sidebar.title("Navigation")
@@ -246,7 +690,7 @@ def payment_verification_page(organization):
     st.title("Payment Verification Required")
     st.warning(f"Your organization ({organization}) needs to complete payment before you can access the system.")
     
-    payments = load_payments()
+    payments = load_payments(readonly=True)
     org_payment = payments.get(organization, {})
     
     if org_payment and org_payment.get('verified', False):
@@ -352,11 +796,13 @@ def staff_view(organization):
                 key = f"{org_key}_{phase}_{doc}"
                 uploaded_file = st.file_uploader(f"Upload {doc}", type=["pdf", "jpg", "png"], key=key)
                 if uploaded_file:
-                    save_path = os.path.join(UPLOAD_FOLDER, f"{org_key}_{uuid.uuid4()}_{uploaded_file.name}")
+                    stored_name = f"{org_key}_{uuid.uuid4()}_{uploaded_file.name}"
+                    save_path = os.path.join(UPLOAD_FOLDER, stored_name)
                     with open(save_path, "wb") as f:
                         f.write(uploaded_file.read())
                     file_state[org_key][phase][doc] = {
                         "filename": uploaded_file.name,
+                        "stored_name": stored_name,
                         "upload_date": datetime.now().isoformat()
                     }
                     save_file_state(file_state)
@@ -398,41 +844,22 @@ def staff_view(organization):
     else:
         st.info("No documents uploaded yet")
 
-def manager_view(organization):
-    if not organization:
-        st.error("Organization information is missing")
-        return
-    
-    if not check_payment_status(organization):
-        payment_verification_page(organization)
-        return
-    
-    st.session_state.payment_verified = True
-    st.header(f"📊 Manager Dashboard - {organization}")
-    
-    # Get all users in the organization
-    users = load_users()
+def _manager_overview(organization):
+    users = load_users(readonly=True)
     org_users = [u for u, data in users.items() 
                 if isinstance(data, dict) and data.get('organization') == organization]
     
-    file_state = load_file_state()
-    
-    # Organization Overview
-    st.subheader("Organization Overview")
-    cols = st.columns(3)
-    cols[0].metric("Total Members", len(org_users))
+    file_state = load_file_state(readonly=True)
     
     # Payment Status
-    payments = load_payments()
-    org_payment = payments.get(organization, {})
+    payment = None
+    org_payment = load_payments(readonly=True).get(organization, {})
     if org_payment:
         expiry_date = org_payment.get('expiry_date', 'N/A')
         days_left = (datetime.strptime(expiry_date, "%Y-%m-%d").date() - date.today()).days if expiry_date != 'N/A' else 0
-        cols[1].metric("Payment Status", "Active" if check_payment_status(organization) else "Expired")
-        cols[2].metric("Days Remaining", days_left if days_left > 0 else 0)
+        payment = ("Active" if check_payment_status(organization) else "Expired", days_left if days_left > 0 else 0)
     
     # Staff Progress
-    st.subheader("Staff Progress")
     progress_data = []
     for user in org_users:
         user_key = f"{organization}_{user}"
@@ -457,20 +884,56 @@ def manager_view(organization):
             "Last Activity": last_activity[:16] if last_activity != "Never" else last_activity
         })
     
-    st.table(pd.DataFrame(progress_data))
+    # Document Status: who has submitted each document
+    submissions = {
+        phase: {
+            doc: [
+                user for user in org_users 
+                if file_state.get(f"{organization}_{user}", {}).get(phase, {}).get(doc)
+            ]
+            for doc in docs
+        }
+        for phase, docs in PHASES.items()
+    }
+    
+    return {'org_users': org_users, 'payment': payment, 'progress': progress_data, 'submissions': submissions}
+
+def load_manager_overview(organization, state):
+    # Only recomputed when one of its tables has changed
+    key = (organization, db_versions(USER_DB, FILE_STATE, PAYMENT_DB), date.today())
+    overview = state.get('manager_overview')
+    if overview is None or overview['key'] != key:
+        overview = dict(_manager_overview(organization), key=key)
+        state['manager_overview'] = overview
+    return overview
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS or None)
+def manager_live_overview(organization):
+    # Re-runs on its own so open dashboards pick up other workers' changes
+    # within LIVE_REFRESH_SECONDS.
+    overview = load_manager_overview(organization, st.session_state)
+    org_users = overview['org_users']
+    
+    # Organization Overview
+    st.subheader("Organization Overview")
+    cols = st.columns(3)
+    cols[0].metric("Total Members", len(org_users))
+    if overview['payment']:
+        cols[1].metric("Payment Status", overview['payment'][0])
+        cols[2].metric("Days Remaining", overview['payment'][1])
+    
+    # Staff Progress
+    st.subheader("Staff Progress")
+    st.table(pd.DataFrame(overview['progress']))
     
     # Document Status
     st.subheader("Document Status")
     
-    for phase, docs in PHASES.items():
+    for phase, docs in overview['submissions'].items():
         st.markdown(f"**{phase}**")
         
-        for doc in docs:
-            # Count uploaded documents
-            uploaded = sum(
-                1 for user in org_users 
-                if file_state.get(f"{organization}_{user}", {}).get(phase, {}).get(doc)
-            )
+        for doc, submitted in docs.items():
+            uploaded = len(submitted)
             
             # Determine status
             if uploaded == len(org_users):
@@ -495,10 +958,6 @@ def manager_view(organization):
             # Show details if not all uploaded
             if uploaded < len(org_users):
                 with st.expander("Details"):
-                    submitted = [
-                        user for user in org_users 
-                        if file_state.get(f"{organization}_{user}", {}).get(phase, {}).get(doc)
-                    ]
                     not_submitted = [user for user in org_users if user not in submitted]
                     
                     if submitted:
@@ -511,6 +970,40 @@ def manager_view(organization):
         
         st.write("---")
 
+def manager_view(organization):
+    if not organization:
+        st.error("Organization information is missing")
+        return
+    
+    if not check_payment_status(organization):
+        payment_verification_page(organization)
+        return
+    
+    st.session_state.payment_verified = True
+    st.header(f"📊 Manager Dashboard - {organization}")
+    
+    manager_live_overview(organization)
+
+    # Dossier Export
+    users = load_users(readonly=True)
+    org_users = [u for u, data in users.items() 
+                if isinstance(data, dict) and data.get('organization') == organization]
+
+    st.subheader("📦 Export Dossier")
+    export_cols = st.columns(2)
+    export_user = export_cols[0].selectbox("Staff", ["All staff"] + org_users, key="export_user")
+    export_phase = export_cols[1].selectbox("Phase", ["All phases"] + list(PHASES), key="export_phase")
+    export_user = None if export_user == "All staff" else export_user
+    export_phase = None if export_phase == "All phases" else export_phase
+
+    if st.button("Prepare Dossier ZIP"):
+        # Served by the export server so the archive streams to the browser
+        # instead of being built in the Streamlit script thread.
+        start_export_server()
+        token = make_dossier_token(organization, export_user, export_phase)
+        st.link_button("Download Dossier", f"{DOSSIER_EXPORT_URL}/dossier/{token}")
+        st.caption(f"Link valid for {DOSSIER_LINK_TTL // 60} minutes")
+
 # ---------------------- AUTHENTICATION ----------------------
 def signup():
     st.subheader("Create Account")
@@ -623,7 +1116,7 @@ def login():
     role = st.selectbox("Role", ROLES, key="login_role")
 
     if st.button("Login"):
-        users = load_users()
+        users = load_users(readonly=True)
         user_data = users.get(username)
         
         if (user_data and isinstance(user_data, dict) and 
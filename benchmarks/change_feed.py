@@ -0,0 +1,140 @@
+"""Benchmark the JSON database cache and cross-process change notification.
+
+Run from the repository root:
+
+    python benchmarks/change_feed.py [--events 10] [--interval SECONDS]
+
+Latency is measured end to end: one process saves file_state, and a second
+process plays an open manager dashboard. It ticks every --interval seconds,
+the way the manager_live_overview fragment does, and calls
+load_manager_overview(). The latency is the time from the save to the tick
+that recomputes the overview, so it is bounded by the refresh interval.
+
+Everything happens in a temporary directory, so existing data files are
+left alone.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_app(workdir):
+    # app.py creates its data files in the working directory on import
+    os.chdir(workdir)
+    sys.path.insert(0, REPO_ROOT)
+    import app
+    return app
+
+
+def _timeit(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def _direct_read(path):
+    with open(path, 'r') as f:
+        data = json.load(f)
+        return {k: v for k, v in data.items() if isinstance(v, dict)}
+
+
+def bench_loads(app):
+    phases = {phase: {doc: {"filename": f"{doc}.pdf", "upload_date": "2026-01-01T00:00:00"}
+                      for doc in docs}
+              for phase, docs in app.PHASES.items()}
+    with open(app.FILE_STATE, 'w') as f:
+        json.dump({f"Org_user{i}": phases for i in range(500)}, f, indent=2)
+    with open(app.USER_DB, 'w') as f:
+        json.dump({f"user{i}": {"organization": "Org", "role": "staff"} for i in range(50)}, f, indent=2)
+
+    print(f"{'table':<16}{'size':>10}{'direct':>12}{'readonly':>12}{'mutable':>12}")
+    for db_file, repeat in ((app.FILE_STATE, 20), (app.USER_DB, 2000)):
+        loader = app.load_file_state if db_file == app.FILE_STATE else app.load_users
+        loader()
+        direct = _timeit(lambda: _direct_read(db_file), repeat)
+        readonly = _timeit(lambda: loader(readonly=True), repeat)
+        mutable = _timeit(loader, repeat)
+        print(f"{db_file:<16}{os.path.getsize(db_file) / 1024:>8.0f}KB"
+              f"{direct * 1e3:>10.3f}ms{readonly * 1e3:>10.3f}ms{mutable * 1e3:>10.3f}ms")
+
+
+def dashboard(workdir, interval, duration):
+    app = _import_app(workdir)
+    state = {}
+    overview = app.load_manager_overview("Org", state)
+    print("ready", flush=True)
+    recomputed = []
+    next_tick = time.time() + random.uniform(0, interval)
+    deadline = time.time() + duration
+    while next_tick < deadline:
+        time.sleep(max(0.0, next_tick - time.time()))
+        if app.load_manager_overview("Org", state) is not overview:
+            overview = state['manager_overview']
+            recomputed.append(time.time())
+        next_tick += interval
+    print(json.dumps(recomputed), flush=True)
+
+
+def bench_latency(app, workdir, events, interval):
+    # Space saves more than one interval apart so each one is picked up by
+    # its own tick.
+    gaps = [random.uniform(interval * 1.2, interval * 2) for _ in range(events)]
+    duration = sum(gaps) + interval * 2
+    worker = subprocess.Popen([sys.executable, os.path.abspath(__file__), '--dashboard', workdir,
+                               '--interval', str(interval), '--duration', str(duration)],
+                              stdout=subprocess.PIPE, text=True)
+    while worker.stdout.readline().strip() != "ready":
+        pass
+    published = []
+    for i, gap in enumerate(gaps):
+        time.sleep(gap)
+        file_state = app.load_file_state()
+        file_state.setdefault("Org_user0", {}).setdefault("Phase 1: Contract", {})["Signed Contract"] = {
+            "filename": f"contract{i}.pdf", "upload_date": datetime.now().isoformat()}
+        published.append(time.time())
+        app.save_file_state(file_state)
+    recomputed = json.loads(worker.stdout.readline())
+    worker.wait()
+
+    latencies = []
+    for sent in published:
+        seen = [t for t in recomputed if t >= sent]
+        if seen:
+            latencies.append(seen[0] - sent)
+    latencies.sort()
+    print(f"\nsave -> dashboard recompute ({len(latencies)}/{events} events, "
+          f"refresh interval {interval:g}s):")
+    print(f"  median {statistics.median(latencies):.3f}s  max {latencies[-1]:.3f}s  "
+          f"(expected: uniform over 0-{interval:g}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, default=10)
+    parser.add_argument('--interval', type=float, default=None,
+                        help="dashboard refresh interval (default: LIVE_REFRESH_SECONDS)")
+    parser.add_argument('--dashboard', metavar='WORKDIR', help=argparse.SUPPRESS)
+    parser.add_argument('--duration', type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.dashboard:
+        dashboard(args.dashboard, args.interval, args.duration)
+        return
+    with tempfile.TemporaryDirectory() as workdir:
+        app = _import_app(workdir)
+        bench_loads(app)
+        bench_latency(app, workdir, args.events, args.interval or app.LIVE_REFRESH_SECONDS)
+
+
+if __name__ == '__main__':
+    main()
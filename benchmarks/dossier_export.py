@@ -0,0 +1,107 @@
+"""Benchmark streamed dossier export throughput and memory.
+
+Run from the repository root:
+
+    python benchmarks/dossier_export.py [--size-mb 2048] [--files 8]
+
+Random (incompressible) PDFs totalling --size-mb are written to a temporary
+directory, then exported twice: by draining iter_dossier_zip() directly and
+by downloading it from the export server over HTTP.
+"""
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+import uuid
+from datetime import datetime
+from http.server import ThreadingHTTPServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WRITE_CHUNK = 16 * 1024 * 1024
+
+
+def _import_app(workdir):
+    # app.py creates its data files in the working directory on import
+    os.chdir(workdir)
+    sys.path.insert(0, REPO_ROOT)
+    import app
+    return app
+
+
+def _max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def build_dossier(app, size_mb, files):
+    docs = [(phase, doc) for phase, phase_docs in app.PHASES.items() for doc in phase_docs][:files]
+    per_file = size_mb * 1024 * 1024 // len(docs)
+    block = os.urandom(WRITE_CHUNK)
+    phases = {}
+    for phase, doc in docs:
+        filename = f"{doc}.pdf"
+        stored_name = f"Bench_exporter_{uuid.uuid4()}_{filename}"
+        with open(os.path.join(app.UPLOAD_FOLDER, stored_name), 'wb') as f:
+            remaining = per_file
+            while remaining:
+                f.write(block[:min(remaining, WRITE_CHUNK)])
+                remaining -= min(remaining, WRITE_CHUNK)
+        phases.setdefault(phase, {})[doc] = {
+            "filename": filename,
+            "stored_name": stored_name,
+            "upload_date": datetime.now().isoformat()
+        }
+    app.save_users({"exporter": {"organization": "Bench", "role": "staff"}})
+    app.save_file_state({"Bench_exporter": phases})
+    return per_file * len(docs)
+
+
+def report(label, total, elapsed):
+    print(f"{label:<10}{total / 2**20:>10.0f} MiB{elapsed:>9.2f} s{total / 2**20 / elapsed:>9.0f} MiB/s"
+          f"{_max_rss_mb():>10.1f} MiB")
+
+
+def bench_generator(app):
+    start = time.perf_counter()
+    total = sum(len(chunk) for chunk in app.iter_dossier_zip("Bench"))
+    report("generator", total, time.perf_counter() - start)
+
+
+def bench_http(app):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), app._DossierExportHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/dossier/{app.make_dossier_token('Bench')}"
+    start = time.perf_counter()
+    total = 0
+    with urllib.request.urlopen(url) as response:
+        while True:
+            chunk = response.read(app.ZIP_CHUNK_SIZE)
+            if not chunk:
+                break
+            total += len(chunk)
+    report("http", total, time.perf_counter() - start)
+    server.shutdown()
+    server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=2048)
+    parser.add_argument('--files', type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        app = _import_app(workdir)
+        size = build_dossier(app, args.size_mb, args.files)
+        print(f"dossier: {args.files} stored PDFs, {size / 2**20:.0f} MiB "
+              f"(peak RSS is for the whole process)")
+        print(f"{'path':<10}{'archive':>14}{'time':>11}{'rate':>15}{'peak RSS':>14}")
+        bench_generator(app)
+        bench_http(app)
+
+
+if __name__ == '__main__':
+    main()
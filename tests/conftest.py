@@ -0,0 +1,26 @@
+import json
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    # app.py keeps its databases in the working directory, so every test
+    # gets a fresh one and a fresh process-wide table cache.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(REPO_ROOT)
+    import app as module
+
+    os.makedirs(module.UPLOAD_FOLDER, exist_ok=True)
+    os.makedirs(module.PAYMENT_UPLOAD_FOLDER, exist_ok=True)
+    for db_file in module.DB_FILES:
+        with open(db_file, 'w') as f:
+            json.dump({}, f)
+    open(module.CHANGE_LOG, 'w').close()
+    module._db_cache.clear()
+    yield module
+    module._db_cache.clear()
@@ -0,0 +1,119 @@
+import json
+import os
+
+import pytest
+
+
+def test_partial_trailing_line_is_held_for_next_read(app):
+    app.publish_change(app.USER_DB)
+    with open(app.CHANGE_LOG, 'ab') as f:
+        f.write(b'{"db": "payments.json", "ts": 1')
+
+    events, position = app.read_changes((os.stat(app.CHANGE_LOG).st_ino, 0))
+    assert [e['db'] for e in events] == [app.USER_DB]
+
+    with open(app.CHANGE_LOG, 'ab') as f:
+        f.write(b'.5, "pid": 1}\n')
+    events, position = app.read_changes(position)
+    assert events == [{'db': app.PAYMENT_DB, 'ts': 1.5, 'pid': 1}]
+    assert position[1] == os.path.getsize(app.CHANGE_LOG)
+
+
+def test_truncation_resets_position(app):
+    app.publish_change(app.USER_DB)
+    app.publish_change(app.USER_DB)
+    position = app._log_position()
+    with open(app.CHANGE_LOG, 'w') as f:
+        f.truncate()
+
+    events, new_position = app.read_changes(position)
+    assert events is None
+    assert new_position == (position[0], 0)
+
+
+def test_rotation_resets_position_and_caches(app, monkeypatch):
+    app.save_users({"alice": {}})
+    assert app.load_users(readonly=True) == {"alice": {}}
+    position = app._db_cache()['position']
+    versions = app.db_versions(*app.DB_FILES)
+
+    monkeypatch.setattr(app, 'CHANGE_LOG_MAX_BYTES', 0)
+    app.publish_change(app.DATA_FILE)
+    assert os.path.getsize(app.CHANGE_LOG) == 0
+    assert os.stat(app.CHANGE_LOG).st_ino != position[0]
+
+    events, _ = app.read_changes(position)
+    assert events is None
+    assert app.sync_changes() == set(app.DB_FILES)
+    assert app.USER_DB not in app._db_cache()['tables']
+    assert all(new > old for new, old in zip(app.db_versions(*app.DB_FILES), versions))
+
+
+def test_change_event_invalidates_cached_table(app):
+    app.save_users({"alice": {}})
+    cached = app.load_users(readonly=True)
+    assert app.load_users(readonly=True) is cached
+
+    app.publish_change(app.USER_DB)
+    assert app.load_users(readonly=True) is not cached
+
+
+def test_write_bypassing_save_is_detected(app):
+    app.save_users({"alice": {}})
+    version = app.db_versions(app.USER_DB)
+    assert app.load_users(readonly=True) == {"alice": {}}
+
+    with open(app.USER_DB, 'w') as f:
+        json.dump({"bob": {}}, f)
+    os.utime(app.USER_DB, ns=(0, os.stat(app.USER_DB).st_mtime_ns + 1))
+    assert app.db_versions(app.USER_DB) != version
+    assert app.load_users(readonly=True) == {"bob": {}}
+
+
+def test_save_replaces_file_atomically_and_publishes(app):
+    inode = os.stat(app.USER_DB).st_ino
+    size = os.path.getsize(app.CHANGE_LOG)
+    app.save_users({"alice": {"role": "staff"}})
+
+    assert os.stat(app.USER_DB).st_ino != inode
+    with open(app.USER_DB) as f:
+        assert json.load(f) == {"alice": {"role": "staff"}}
+    assert not [name for name in os.listdir('.') if name.endswith('.tmp')]
+    with open(app.CHANGE_LOG, 'rb') as f:
+        f.seek(size)
+        assert json.loads(f.read())['db'] == app.USER_DB
+
+
+def test_failed_save_leaves_database_and_no_temp_file(app):
+    app.save_users({"alice": {}})
+    with pytest.raises(TypeError):
+        app.save_users({"bob": {"tags": {1, 2}}})
+
+    assert not [name for name in os.listdir('.') if name.endswith('.tmp')]
+    assert app.load_users() == {"alice": {}}
+
+
+def test_readonly_load_is_shared_and_default_is_private(app):
+    app.save_file_state({"Acme_alice": {"Phase 1: Contract": {}}})
+    shared = app.load_file_state(readonly=True)
+    assert app.load_file_state(readonly=True) is shared
+
+    private = app.load_file_state()
+    assert private == shared and private is not shared
+    private["Acme_alice"]["Phase 1: Contract"]["Signed Contract"] = {"filename": "x.pdf"}
+    private["Acme_bob"] = {}
+    assert app.load_file_state(readonly=True) == {"Acme_alice": {"Phase 1: Contract": {}}}
+    assert app.load_file_state() == {"Acme_alice": {"Phase 1: Contract": {}}}
+
+
+def test_manager_overview_recomputed_only_on_change(app):
+    app.save_users({"alice": {"organization": "Acme"}, "bob": {"organization": "Other"}})
+    state = {}
+    overview = app.load_manager_overview("Acme", state)
+    assert overview['org_users'] == ["alice"]
+    assert app.load_manager_overview("Acme", state) is overview
+
+    app.save_file_state({"Acme_alice": {"Phase 1: Contract": {"Signed Contract": {"upload_date": "2026-01-01"}}}})
+    updated = app.load_manager_overview("Acme", state)
+    assert updated is not overview
+    assert updated['submissions']["Phase 1: Contract"]["Signed Contract"] == ["alice"]
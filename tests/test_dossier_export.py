@@ -0,0 +1,199 @@
+import http.client
+import io
+import json
+import os
+import stat
+import struct
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+import zipfile
+from datetime import datetime
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+
+def _upload(app, user, phase, doc, filename, data, when, legacy=False):
+    org_key = f"Acme_{user}"
+    stored_name = f"{org_key}_{uuid.uuid4()}_{filename}"
+    path = os.path.join(app.UPLOAD_FOLDER, stored_name)
+    with open(path, 'wb') as f:
+        f.write(data)
+    os.utime(path, (when, when))
+    meta = {"filename": filename, "upload_date": datetime.fromtimestamp(when + 0.5).isoformat()}
+    if not legacy:
+        meta["stored_name"] = stored_name
+    return org_key, phase, doc, meta
+
+
+@pytest.fixture
+def dossier(app):
+    app.save_users({
+        "alice": {"organization": "Acme", "role": "staff"},
+        "bob": {"organization": "Acme", "role": "staff"},
+        "carol": {"organization": "Other", "role": "staff"}
+    })
+    now = time.time()
+    uploads = [
+        _upload(app, "alice", "Phase 1: Contract", "Signed Contract", "contract.pdf", os.urandom(4096), now - 60),
+        # The same legacy filename uploaded for two documents
+        _upload(app, "bob", "Phase 1: Contract", "Signed Contract", "scan.pdf", b"A" * 1000, now - 5000, legacy=True),
+        _upload(app, "bob", "Phase 1: Contract", "Registration Form", "scan.pdf", b"B" * 1000, now - 60, legacy=True),
+        _upload(app, "bob", "Phase 2: LC Payment (if applicable)", "LC Document", "lc.txt", b"lc" * 500, now - 30,
+                legacy=True),
+    ]
+    # Same shape as an upload but the middle segment is not a UUID
+    with open(os.path.join(app.UPLOAD_FOLDER, "Acme_bob_" + "x" * 36 + "_lc.txt"), 'wb') as f:
+        f.write(b"wrong")
+
+    file_state = {}
+    for org_key, phase, doc, meta in uploads:
+        file_state.setdefault(org_key, {}).setdefault(phase, {})[doc] = meta
+    app.save_file_state(file_state)
+    return app
+
+
+def _archive(app, *args):
+    data = b"".join(app.iter_dossier_zip(*args))
+    return data, zipfile.ZipFile(io.BytesIO(data))
+
+
+def test_archive_is_valid_and_stored_entries_have_no_data_descriptor(dossier):
+    data, zf = _archive(dossier, "Acme")
+    assert zf.testzip() is None
+
+    for info in zf.infolist():
+        signature, _, flags = struct.unpack('<IHH', data[info.header_offset:info.header_offset + 8])
+        assert signature == 0x04034b50
+        if info.compress_type == zipfile.ZIP_STORED:
+            assert not flags & 0x08, info.filename
+
+    assert zf.getinfo("alice/Phase 1_ Contract/Signed Contract - contract.pdf").compress_type == zipfile.ZIP_STORED
+    assert zf.getinfo("manifest.json").compress_type == zipfile.ZIP_STORED
+    lc_path = "bob/Phase 2_ LC Payment (if applicable)/LC Document - lc.txt"
+    assert zf.getinfo(lc_path).compress_type == zipfile.ZIP_DEFLATED
+    assert zf.read(lc_path) == b"lc" * 500
+
+
+def test_zip64_entries_are_readable(dossier, monkeypatch):
+    monkeypatch.setattr(zipfile, 'ZIP64_LIMIT', 100)
+    _, zf = _archive(dossier, "Acme")
+    assert zf.testzip() is None
+
+
+def test_manifest_lists_documents_and_missing(dossier):
+    _, zf = _archive(dossier, "Acme")
+    manifest = json.loads(zf.read("manifest.json"))
+
+    documents = {(d["user"], d["document"]): d for d in manifest["documents"]}
+    assert set(documents) == {("alice", "Signed Contract"), ("bob", "Signed Contract"),
+                              ("bob", "Registration Form"), ("bob", "LC Document")}
+    for item in manifest["documents"]:
+        assert item["size"] == len(zf.read(item["archive_path"]))
+
+    missing = {(m["user"], m["document"]) for m in manifest["missing"]}
+    total = sum(len(docs) for docs in dossier.PHASES.values())
+    assert len(missing) == 2 * total - len(documents)
+    assert ("alice", "Registration Form") in missing
+    assert not any(m["user"] == "carol" for m in manifest["missing"])
+
+
+def test_archive_scoped_to_user_and_phase(dossier):
+    _, zf = _archive(dossier, "Acme", "bob", "Phase 1: Contract")
+    manifest = json.loads(zf.read("manifest.json"))
+    assert {d["document"] for d in manifest["documents"]} == {"Signed Contract", "Registration Form"}
+    assert {m["document"] for m in manifest["missing"]} == set()
+
+
+def test_legacy_uploads_match_closest_upload_date(dossier):
+    _, zf = _archive(dossier, "Acme", "bob")
+    assert zf.read("bob/Phase 1_ Contract/Signed Contract - scan.pdf") == b"A" * 1000
+    assert zf.read("bob/Phase 1_ Contract/Registration Form - scan.pdf") == b"B" * 1000
+
+    matches = {d["document"]: d["match"] for d in json.loads(zf.read("manifest.json"))["documents"]}
+    assert matches == {"Signed Contract": "ambiguous", "Registration Form": "ambiguous", "LC Document": "inferred"}
+
+    _, zf = _archive(dossier, "Acme", "alice")
+    assert [d["match"] for d in json.loads(zf.read("manifest.json"))["documents"]] == ["recorded"]
+
+
+def test_entry_timestamps_are_stable(dossier):
+    _, first = _archive(dossier, "Acme")
+    _, second = _archive(dossier, "Acme")
+    documents = [info.date_time for info in first.infolist() if info.filename != "manifest.json"]
+    assert documents == [info.date_time for info in second.infolist() if info.filename != "manifest.json"]
+
+
+@pytest.fixture
+def export_url(dossier):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), dossier._DossierExportHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/dossier/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_export_server_streams_signed_links(dossier, export_url):
+    token = dossier.make_dossier_token("Acme", "bob")
+    with urllib.request.urlopen(export_url + token) as response:
+        assert response.headers["Transfer-Encoding"] == "chunked"
+        assert "Acme_bob_" in response.headers["Content-Disposition"]
+        zf = zipfile.ZipFile(io.BytesIO(response.read()))
+    assert zf.testzip() is None
+    assert all(name.startswith("bob/") for name in zf.namelist() if name != "manifest.json")
+
+
+def test_export_server_rejects_tampered_and_expired_tokens(dossier, export_url, monkeypatch):
+    token = dossier.make_dossier_token("Acme")
+    payload, _, signature = token.partition('.')
+    forged = dossier.make_dossier_token("Other").partition('.')[0] + '.' + signature
+    tampered = payload + '.' + ('0' if signature[0] != '0' else '1') + signature[1:]
+
+    monkeypatch.setattr(dossier, 'DOSSIER_LINK_TTL', -1)
+    expired = dossier.make_dossier_token("Acme")
+
+    for bad in (forged, tampered, expired, "garbage", ""):
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(export_url + bad)
+        assert excinfo.value.code == 404
+
+
+def test_export_secret_is_private(app, monkeypatch):
+    monkeypatch.delenv('DOSSIER_EXPORT_SECRET', raising=False)
+    secret = app._export_secret()
+    assert secret and secret == app._export_secret()
+    assert stat.S_IMODE(os.stat(app.EXPORT_SECRET_FILE).st_mode) == 0o600
+
+
+def test_export_server_fails_cleanly_when_a_file_disappears(dossier, export_url, monkeypatch, capfd):
+    def failing_zip(*args):
+        yield b"PK"
+        raise FileNotFoundError("gone")
+
+    monkeypatch.setattr(dossier, 'iter_dossier_zip', failing_zip)
+    with pytest.raises(http.client.IncompleteRead):
+        with urllib.request.urlopen(export_url + dossier.make_dossier_token("Acme")) as response:
+            response.read()
+    err = capfd.readouterr().err
+    assert "dossier export failed" in err
+    assert "Traceback" not in err
+
+
+def test_export_server_retries_after_failed_bind(app, monkeypatch):
+    blocker = ThreadingHTTPServer(("127.0.0.1", 0), app._DossierExportHandler)
+    monkeypatch.setattr(app, 'DOSSIER_EXPORT_HOST', "127.0.0.1")
+    monkeypatch.setattr(app, 'DOSSIER_EXPORT_PORT', blocker.server_address[1])
+    app._export_server_slot.clear()
+
+    assert app.start_export_server() is None
+    blocker.server_close()
+    server = app.start_export_server()
+    try:
+        assert server is not None and app.start_export_server() is server
+    finally:
+        server.shutdown()
+        server.server_close()
+        app._export_server_slot.clear()